@@ -12,7 +12,7 @@ import textwrap
 from enum import Enum
 from pathlib import Path
 from pprint import pformat
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
 import yaml
 from deepdiff import DeepDiff
@@ -23,25 +23,29 @@ from tqdm import tqdm
 from everyvoice.config.type_definitions import TargetTrainingTextRepresentationLevel
 from everyvoice.exceptions import InvalidConfiguration
 from everyvoice.model.aligner.config import DFAlignerConfig
-from everyvoice.model.aligner.DeepForcedAligner.dfaligner.dataset import (
-    AlignerDataModule,
-)
-from everyvoice.model.aligner.DeepForcedAligner.dfaligner.model import Aligner
 from everyvoice.model.e2e.config import EveryVoiceConfig
-from everyvoice.model.e2e.dataset import E2EDataModule
-from everyvoice.model.e2e.model import EveryVoice
 from everyvoice.model.feature_prediction.config import FastSpeech2Config
-from everyvoice.model.feature_prediction.FastSpeech2_lightning.fs2.dataset import (
-    FastSpeech2DataModule,
-)
-from everyvoice.model.feature_prediction.FastSpeech2_lightning.fs2.model import (
-    FastSpeech2,
-)
 from everyvoice.model.vocoder.config import HiFiGANConfig
-from everyvoice.model.vocoder.HiFiGAN_iSTFT_lightning.hfgl.dataset import (
-    HiFiGANDataModule,
-)
-from everyvoice.model.vocoder.HiFiGAN_iSTFT_lightning.hfgl.model import HiFiGAN
+
+if TYPE_CHECKING:
+    # The data modules and models import pytorch_lightning and torch, which
+    # load_unknown_config() and the other config helpers don't need.
+    from everyvoice.model.aligner.DeepForcedAligner.dfaligner.dataset import (
+        AlignerDataModule,
+    )
+    from everyvoice.model.aligner.DeepForcedAligner.dfaligner.model import Aligner
+    from everyvoice.model.e2e.dataset import E2EDataModule
+    from everyvoice.model.e2e.model import EveryVoice
+    from everyvoice.model.feature_prediction.FastSpeech2_lightning.fs2.dataset import (
+        FastSpeech2DataModule,
+    )
+    from everyvoice.model.feature_prediction.FastSpeech2_lightning.fs2.model import (
+        FastSpeech2,
+    )
+    from everyvoice.model.vocoder.HiFiGAN_iSTFT_lightning.hfgl.dataset import (
+        HiFiGANDataModule,
+    )
+    from everyvoice.model.vocoder.HiFiGAN_iSTFT_lightning.hfgl.model import HiFiGAN
 
 MODEL_CONFIGS = [FastSpeech2Config, HiFiGANConfig, DFAlignerConfig]
 
@@ -184,12 +188,14 @@ def train_base_command(
         type[HiFiGANConfig],
     ],
     data_module: Union[
-        type[AlignerDataModule],
-        type[E2EDataModule],
-        type[FastSpeech2DataModule],
-        type[HiFiGANDataModule],
+        type["AlignerDataModule"],
+        type["E2EDataModule"],
+        type["FastSpeech2DataModule"],
+        type["HiFiGANDataModule"],
+    ],
+    model: Union[
+        type["Aligner"], type["EveryVoice"], type["FastSpeech2"], type["HiFiGAN"]
     ],
-    model: Union[type[Aligner], type[EveryVoice], type[FastSpeech2], type[HiFiGAN]],
     monitor: str,
     # Must include the above in model-specific command
     config_args: List[str],
@@ -223,6 +229,7 @@ def train_base_command(
     pbar.update()
     pbar.refresh()
     pbar.set_description("Loading EveryVoice modules")
+    from everyvoice.model.e2e.model import EveryVoice
 
     pbar.update()
     pbar.refresh()
@@ -91,33 +91,44 @@ class ConfigModel(BaseModel):
 
     def update_config(self, new_config: dict):
         """Update the config with new values"""
+        if not new_config:
+            # Nothing to override: skip rebuilding and revalidating the model
+            return self
         new_data = self.combine_configs(dict(self), new_config)
         self.__init__(**new_data)  # type: ignore
         return self
 
     @staticmethod
     def combine_configs(orig_dict: Union[dict, Sequence], new_dict: Mapping):
-        """See https://stackoverflow.com/questions/3232943/update-value-of-a-nested-dictionary-of-varying-depth"""
-        if isinstance(orig_dict, Sequence):
-            orig_list = list(orig_dict)
-            for key_s, val in new_dict.items():
-                key_i = int(key_s)
+        """See https://stackoverflow.com/questions/3232943/update-value-of-a-nested-dictionary-of-varying-depth
+
+        Walks new_dict with a work list instead of recursing. Only the containers
+        along the updated paths are copied; untouched subtrees are shared with
+        orig_dict rather than cloned. In lists, keys are indices, e.g., "0".
+        """
+
+        def copy_container(container):
+            if isinstance(container, Sequence):
+                return list(container)
+            return dict(container)
+
+        combined = copy_container(orig_dict)
+        work_list = [(combined, new_dict)]
+        while work_list:
+            target, updates = work_list.pop()
+            is_list = isinstance(target, list)
+            for key, val in updates.items():
+                if is_list:
+                    key = int(key)
                 if isinstance(val, Mapping):
-                    tmp = ConfigModel.combine_configs(orig_list[key_i], val)
-                    orig_list[key_i] = tmp
+                    child = copy_container(
+                        target[key] if is_list else target.get(key, {})
+                    )
+                    target[key] = child
+                    work_list.append((child, val))
                 else:
-                    orig_list[key_i] = val
-            return orig_list
-
-        orig_dict = dict(orig_dict)
-        new_dict = dict(new_dict)
-        for key, val in new_dict.items():
-            if isinstance(val, Mapping):
-                tmp = ConfigModel.combine_configs(orig_dict.get(key, {}), val)
-                orig_dict[key] = tmp
-            else:
-                orig_dict[key] = new_dict[key]
-        return orig_dict
+                    target[key] = val
+        return combined
 
 
 class PartialLoadConfig(ConfigModel):
@@ -1,4 +1,4 @@
-import os
+from functools import cached_property
 from pathlib import Path
 from typing import Callable, Optional, Union
 
@@ -13,6 +13,22 @@ from everyvoice.model.feature_prediction.config import FeaturePredictionConfig
 from everyvoice.model.vocoder.config import VocoderConfig
 
 
+def _worker_options(num_workers: int) -> dict:
+    """DataLoader options for num_workers worker processes.
+
+    With workers, keep them alive between epochs instead of re-spawning them
+    (and re-unpickling the dataset) each time, and let each one prepare a few
+    batches ahead. DataLoader rejects these options when num_workers is 0.
+    """
+    if num_workers > 0:
+        return {
+            "num_workers": num_workers,
+            "persistent_workers": True,
+            "prefetch_factor": 4,
+        }
+    return {"num_workers": num_workers}
+
+
 class BaseDataModule(pl.LightningDataModule):
     def __init__(
         self,
@@ -25,20 +41,22 @@ class BaseDataModule(pl.LightningDataModule):
         self.collate_fn: Union[Callable, None] = None
         self.config = config
         self.use_weighted_sampler = False
+        # (dataset, sampler) pairs, so weights are only computed once per dataset
+        self._samplers: dict[str, tuple] = {}
         self.inference_output_dir = inference_output_dir
         if self.inference_output_dir is not None:
             self.inference_output_dir.mkdir(exist_ok=True, parents=True)
             self.predict_path = self.inference_output_dir / "latest_predict_data.pth"
-        self.train_path = os.path.join(
-            self.config.training.logger.save_dir,
-            self.config.training.logger.name,
-            "train_data.pth",
-        )
-        self.val_path = os.path.join(
-            self.config.training.logger.save_dir,
-            self.config.training.logger.name,
-            "val_data.pth",
-        )
+
+    @cached_property
+    def train_path(self) -> Path:
+        logger = self.config.training.logger
+        return Path(logger.save_dir) / logger.name / "train_data.pth"
+
+    @cached_property
+    def val_path(self) -> Path:
+        logger = self.config.training.logger
+        return Path(logger.save_dir) / logger.name / "val_data.pth"
 
     def setup(self, stage: Optional[str] = None):
         # load it back here
@@ -53,20 +71,29 @@ class BaseDataModule(pl.LightningDataModule):
         if stage == "predict":
             self.predict_dataset = torch.load(self.predict_path, weights_only=False)
 
+    def _get_sampler(self, split: str, dataset) -> Optional[ImbalancedDatasetSampler]:
+        """Return the weighted sampler for dataset, reusing the one built for the
+        same dataset by a previous call, since Lightning can ask for fresh
+        dataloaders every epoch and computing the weights scans the dataset.
+        """
+        if not self.use_weighted_sampler:
+            return None
+        cached = self._samplers.get(split)
+        if cached is None or cached[0] is not dataset:
+            cached = (dataset, ImbalancedDatasetSampler(dataset))
+            self._samplers[split] = cached
+        return cached[1]
+
     def train_dataloader(self):
-        sampler = (
-            ImbalancedDatasetSampler(self.train_dataset)
-            if self.use_weighted_sampler
-            else None
-        )
+        sampler = self._get_sampler("train", self.train_dataset)
         return DataLoader(
             self.train_dataset,
             batch_size=self.batch_size,
-            num_workers=self.config.training.train_data_workers,
             pin_memory=False,
             drop_last=True,
             collate_fn=self.collate_fn,
             sampler=sampler,
+            **_worker_options(self.config.training.train_data_workers),
         )
 
     def predict_dataloader(self):
@@ -80,19 +107,17 @@ class BaseDataModule(pl.LightningDataModule):
         )
 
     def val_dataloader(self):
-        sampler = (
-            ImbalancedDatasetSampler(self.val_dataset)
-            if self.use_weighted_sampler
-            else None
-        )
+        sampler = self._get_sampler("val", self.val_dataset)
+        # Validation stays at one utterance per batch: the models' validation
+        # steps log per-utterance audio and spectrograms of varying lengths.
         return DataLoader(
             self.val_dataset,
             batch_size=1,
-            num_workers=0,
             pin_memory=False,
             drop_last=True,
             collate_fn=self.collate_fn,
             sampler=sampler,
+            **_worker_options(self.config.training.val_data_workers),
         )
 
     def prepare_data(self):
@@ -23,7 +23,7 @@ import numpy.typing as npt
 import torch
 import torchaudio
 from clipdetect import detect_clipping
-from joblib import Parallel, delayed
+from joblib import delayed
 from loguru import logger
 from rich import print as rich_print
 from rich.panel import Panel
@@ -49,7 +49,7 @@ from everyvoice.text.text_processor import TextProcessor
 from everyvoice.utils import (
     generic_psv_filelist_reader,
     n_times,
-    tqdm_joblib_context,
+    tqdm_joblib_parallel,
     write_filelist,
 )
 from everyvoice.utils.heavy import (
@@ -147,6 +147,29 @@ class Preprocessor:
         Returns:
             Tensor: (audio as a Tensor, sampling rate)
         """
+        loaded = self.load_audio_with_effects(wav_path, sox_effects, update_counters)
+        if loaded is None:
+            return None, None
+        return self.finish_processing_audio(
+            *loaded,
+            normalize=normalize,
+            resample_rate=resample_rate,
+            hop_size=hop_size,
+            update_counters=update_counters,
+        )
+
+    def load_audio_with_effects(
+        self, wav_path: Path, sox_effects=None, update_counters=True
+    ) -> tuple[torch.Tensor, int, float] | None:
+        """Load audio, check that it is usable and apply the SoX effects
+
+        This is the first half of process_audio(); the result can be passed to
+        finish_processing_audio() several times, e.g., for different sampling rates.
+
+        Returns:
+            (audio as a Tensor, sampling rate, duration in seconds), or None if
+            the audio should be skipped
+        """
         audio, sr, seconds = self.load_audio(wav_path)
 
         if seconds > self.audio_config.max_audio_length:
@@ -155,14 +178,14 @@ class Preprocessor:
             )
             if update_counters:
                 self.counters.increment("audio_too_long")
-            return None, None
+            return None
         if seconds < self.audio_config.min_audio_length:
             logger.warning(
                 f"Audio too short: {wav_path} ({seconds} seconds - we will skip this file)"
             )
             if update_counters:
                 self.counters.increment("audio_too_short")
-            return None, None
+            return None
 
         loudness_transform = torchaudio.transforms.Loudness(sr)
         loudness = loudness_transform(audio)
@@ -172,7 +195,7 @@ class Preprocessor:
             logger.warning(f"Audio empty: {wav_path} - we will skip this file")
             if update_counters:
                 self.counters.increment("audio_empty")
-            return None, None
+            return None
 
         if sox_effects:
             if os.name == "nt":  # pragma: no cover
@@ -200,13 +223,31 @@ class Preprocessor:
                     sr,
                     sox_effects,
                 )
+        return audio, sr, seconds
+
+    def finish_processing_audio(
+        self,
+        audio: torch.Tensor,
+        sr: int,
+        seconds: float,
+        normalize=True,
+        resample_rate=None,
+        hop_size=None,
+        update_counters=True,
+    ) -> tuple[torch.Tensor, int]:
+        """Resample, normalize and trim audio from load_audio_with_effects()
 
+        audio is not modified, so the same audio can be finished more than once.
+
+        Returns:
+            Tensor: (audio as a Tensor, sampling rate)
+        """
         if resample_rate is not None and resample_rate != sr:
             audio = resample(audio, sr, resample_rate)
             sr = resample_rate
         if normalize:
-            audio /= torch.max(torch.abs(audio))
-            audio *= 0.95
+            audio = audio / torch.max(torch.abs(audio))
+            audio = audio * 0.95
 
         if update_counters:
             self.counters.increment("processed_files")
@@ -367,8 +408,7 @@ class Preprocessor:
     def compute_stats(
         self, energy=True, pitch=True
     ) -> tuple[Optional[Scaler], Optional[Scaler]]:
-        if self.cpus > 1:
-            parallel = Parallel(n_jobs=self.cpus, backend="loky", batch_size=500)
+        parallel_kwargs = {"n_jobs": self.cpus, "backend": "loky", "batch_size": 500}
         if energy:
             energy_scaler = Scaler()
             # Until Python 3.13, pathlib.Path.glob() doesn't work with symlinks: https://github.com/python/cpython/issues/77609
@@ -378,11 +418,12 @@ class Preprocessor:
             )
             if self.cpus > 1:
                 logger.info("Gathering energy values")
-                with tqdm_joblib_context(tqdm(desc="Gathering energy values")):
-                    for energy_data in parallel(
-                        delayed(torch.load)(path, weights_only=True) for path in paths
-                    ):
-                        energy_scaler.data.append(energy_data)
+                for energy_data in tqdm_joblib_parallel(
+                    (delayed(torch.load)(path, weights_only=True) for path in paths),
+                    tqdm(desc="Gathering energy values", total=len(paths)),
+                    **parallel_kwargs,
+                ):
+                    energy_scaler.data.append(energy_data)
             else:
                 for path in tqdm(paths, desc="Gathering energy values"):
                     energy_data = torch.load(path, weights_only=True)
@@ -396,11 +437,12 @@ class Preprocessor:
             )
             if self.cpus > 1:
                 logger.info("Gathering pitch values")
-                with tqdm_joblib_context(tqdm(desc="Gathering pitch values")):
-                    for pitch_data in parallel(
-                        delayed(torch.load)(path, weights_only=True) for path in paths
-                    ):
-                        pitch_scaler.data.append(pitch_data)
+                for pitch_data in tqdm_joblib_parallel(
+                    (delayed(torch.load)(path, weights_only=True) for path in paths),
+                    tqdm(desc="Gathering pitch values", total=len(paths)),
+                    **parallel_kwargs,
+                ):
+                    pitch_scaler.data.append(pitch_data)
             else:
                 for path in tqdm(paths, desc="Gathering pitch values"):
                     pitch_data = torch.load(path, weights_only=True)
@@ -494,44 +536,49 @@ class Preprocessor:
             self.counters.increment("previously_processed_files")
             self.counters.increment("duration", seconds)
             return item
-        if not input_audio_save_path.exists() or self.overwrite:
-            input_audio, save_sr = self.process_audio(
-                audio_path,
+        process_input = not input_audio_save_path.exists() or self.overwrite
+        process_output = (
+            self.input_sampling_rate != self.output_sampling_rate
+            and not output_audio_save_path.exists()
+            or self.overwrite
+        )
+        if not (process_input or process_output):
+            return item
+        # Load, check and apply the SoX effects only once, even when we need the
+        # audio at both the input and the output sampling rates
+        loaded = self.load_audio_with_effects(
+            audio_path, sox_effects, update_counters=process_input
+        )
+        if loaded is None:
+            return None if process_input else item
+        if process_input:
+            input_audio, save_sr = self.finish_processing_audio(
+                *loaded,
                 resample_rate=self.input_sampling_rate,
-                sox_effects=sox_effects,
                 hop_size=self.audio_config.fft_hop_size,
             )
-            if input_audio is None:
-                return None
-            else:
-                input_audio = input_audio.unsqueeze(0)
-                save_wav(
-                    input_audio,
-                    input_audio_save_path,
-                    save_sr,
-                    self.audio_config.target_bit_depth,
-                )
+            input_audio = input_audio.unsqueeze(0)
+            save_wav(
+                input_audio,
+                input_audio_save_path,
+                save_sr,
+                self.audio_config.target_bit_depth,
+            )
 
-        if (
-            self.input_sampling_rate != self.output_sampling_rate
-            and not output_audio_save_path.exists()
-            or self.overwrite
-        ):
-            output_audio, save_sr = self.process_audio(
-                audio_path,
+        if process_output:
+            output_audio, save_sr = self.finish_processing_audio(
+                *loaded,
                 resample_rate=self.output_sampling_rate,
-                sox_effects=sox_effects,
                 update_counters=False,
                 hop_size=self.output_hop_size,
             )
-            if output_audio is not None:
-                output_audio = output_audio.unsqueeze(0)
-                save_wav(
-                    output_audio,
-                    input_audio_save_path,
-                    save_sr,
-                    self.audio_config.target_bit_depth,
-                )
+            output_audio = output_audio.unsqueeze(0)
+            save_wav(
+                output_audio,
+                input_audio_save_path,
+                save_sr,
+                self.audio_config.target_bit_depth,
+            )
         return item
 
     def process_all_audio(self) -> list[dict]:
@@ -553,21 +600,19 @@ class Preprocessor:
             if self.cpus > 1:
                 logger.info("Launching parallel processes may take a moment...")
                 batch_size = min(100, 1 + len(filelist) // (self.cpus * 2))
-                with tqdm_joblib_context(
+                processed_items = tqdm_joblib_parallel(
+                    (
+                        delayed(self.process_one_audio)(item, data_dir, sox_effects)
+                        for item in filelist
+                    ),
                     tqdm(
                         desc=f"Processing audio on {self.cpus} CPUs",
                         total=len(filelist),
-                    )
-                ):
-                    processed_items = Parallel(
-                        n_jobs=self.cpus,
-                        # verbose=10,
-                        backend="loky",
-                        batch_size=batch_size,
-                    )(
-                        delayed(self.process_one_audio)(item, data_dir, sox_effects)
-                        for item in filelist
-                    )
+                    ),
+                    n_jobs=self.cpus,
+                    backend="loky",
+                    batch_size=batch_size,
+                )
                 filtered_filelist.extend(
                     item for item in processed_items if item is not None
                 )
@@ -1200,17 +1245,17 @@ class Preprocessor:
                 # logger.info(f"Filelist len={len(filelist or [])}")
                 if self.cpus > 1:
                     batch_size = min(100, 1 + len(filelist) // (self.cpus * 2))
-                    with tqdm_joblib_context(
+                    for _ in tqdm_joblib_parallel(
+                        (delayed(process_fn)(file) for file in filelist),
                         tqdm(
                             desc=f"Processing {process} on {self.cpus} CPUs",
                             total=len(filelist),
-                        )
+                        ),
+                        n_jobs=self.cpus,
+                        backend="loky",
+                        batch_size=batch_size,
                     ):
-                        Parallel(
-                            n_jobs=self.cpus,
-                            backend="loky",
-                            batch_size=batch_size,
-                        )(delayed(process_fn)(file) for file in filelist)
+                        pass
                 else:
                     for f in tqdm(filelist, desc=f"Processing {process} on 1 CPU"):
                         process_fn(f)
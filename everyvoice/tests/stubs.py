@@ -21,6 +21,8 @@ class monkeypatch:
 
     _NOTSET = object()  # Sentinel object for monkeypatch()
 
+    __slots__ = ("obj", "name", "value", "saved_value")
+
     def __init__(self, obj, name, value):
         self.obj = obj
         self.name = name
@@ -200,6 +202,8 @@ class patch_input:
 class null_patch:
     """dummy context manager when we must pass a monkeypatch but have nothing to patch"""
 
+    __slots__ = ()
+
     def __enter__(self):
         return None
 
@@ -211,17 +215,19 @@ class Say:
     """Mock callable that returns response (if multi=False) or each value in
     response in turn (if multi=True) when it is called."""
 
+    __slots__ = ("response", "last_index", "multi")
+
     def __init__(self, response, multi=False) -> None:
         self.response = response
         self.last_index = -1
         self.multi = multi
 
     def __call__(self, *args: Any, **kwds: Any) -> Any:
-        if self.multi:
+        if not self.multi:
+            response = self.response
+        else:
             self.last_index += 1
             response = self.response[self.last_index]
-        else:
-            response = self.response
         if isinstance(response, BaseException):
             raise response
         return response
@@ -1,5 +1,6 @@
 import json
 import time
+from functools import cached_property
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Callable
@@ -19,6 +20,7 @@ from everyvoice.config.preprocessing_config import (
 )
 from everyvoice.config.shared_types import (
     BaseTrainingConfig,
+    ConfigModel,
     LoggerConfig,
     init_context,
 )
@@ -59,9 +61,11 @@ def _writer_helper(model, filename):
 class ConfigTest(BasicTestCase):
     """Basic test for hyperparameter configuration"""
 
-    def setUp(self) -> None:
-        super().setUp()
-        self.config = EveryVoiceConfig(
+    @cached_property
+    def config(self) -> EveryVoiceConfig:
+        """A fresh default config, built on first use since few tests need it
+        and some of those modify it"""
+        return EveryVoiceConfig(
             contact=self.contact,
             aligner=AlignerConfig(contact=self.contact),
             feature_prediction=FeaturePredictionConfig(contact=self.contact),
@@ -284,6 +288,27 @@ class ConfigTest(BasicTestCase):
         config = base_config.combine_configs(base_config, test_dict)
         self.assertEqual(config["vocoder"]["training"]["gan_type"], "wgan")
 
+    def test_combine_configs(self):
+        """Sibling keys survive a nested override and the original is untouched"""
+        orig = {"a": {"b": 1, "c": 2}, "d": [{"e": 3}, {"f": 4}], "g": {"h": 5}}
+        combined = ConfigModel.combine_configs(
+            orig, {"a": {"c": 6}, "d": {"1": {"f": 7}}, "i": {"j": 8}}
+        )
+        self.assertEqual(
+            combined,
+            {
+                "a": {"b": 1, "c": 6},
+                "d": [{"e": 3}, {"f": 7}],
+                "g": {"h": 5},
+                "i": {"j": 8},
+            },
+        )
+        self.assertEqual(orig["a"], {"b": 1, "c": 2})
+        self.assertEqual(orig["d"][1], {"f": 4})
+        # Untouched subtrees are shared, not copied
+        self.assertIs(combined["g"], orig["g"])
+        self.assertIs(combined["d"][0], orig["d"][0])
+
     def test_changes(self):
         """Test that the changes to the config are correct"""
         self.config.update_config(
@@ -291,6 +316,12 @@ class ConfigTest(BasicTestCase):
         )
         self.assertEqual(self.config.feature_prediction.text.cleaners, [lower])
 
+    def test_empty_update_keeps_config(self):
+        """An empty update returns the same, unrebuilt config"""
+        text_config = self.config.feature_prediction.text
+        self.assertIs(self.config.update_config({}), self.config)
+        self.assertIs(self.config.feature_prediction.text, text_config)
+
     def test_load_empty_config(self):
         with NamedTemporaryFile(
             prefix="test_load_empty_config", mode="w", suffix=".yaml"
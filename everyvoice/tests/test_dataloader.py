@@ -56,24 +56,17 @@ class DataLoaderTest(PreprocessedAudioFixture, BasicTestCase):
             self.config.vocoder,
             use_segments=True,
         )
+        audio_config = self.config.vocoder.preprocessing.audio
+        expected_n_frames = audio_config.vocoder_segment_size / (
+            audio_config.fft_hop_size
+            * (audio_config.output_sampling_rate // audio_config.input_sampling_rate)
+        )
         for sample in dataset:
             spec, audio, basename, spec_from_audio = sample
             self.assertTrue(isinstance(basename, str))
             self.assertEqual(spec.size(), spec_from_audio.size())
-            self.assertEqual(
-                spec.size(0), self.config.vocoder.preprocessing.audio.n_mels
-            )
-            self.assertEqual(
-                spec.size(1),
-                self.config.vocoder.preprocessing.audio.vocoder_segment_size
-                / (
-                    self.config.vocoder.preprocessing.audio.fft_hop_size
-                    * (
-                        self.config.vocoder.preprocessing.audio.output_sampling_rate
-                        // self.config.vocoder.preprocessing.audio.input_sampling_rate
-                    )
-                ),
-            )
+            self.assertEqual(spec.size(0), audio_config.n_mels)
+            self.assertEqual(spec.size(1), expected_n_frames)
 
     def test_hifi_data_loader(self):
         hfgdm = HiFiGANDataModule(self.config.vocoder)
@@ -138,3 +131,20 @@ class DataLoaderTest(PreprocessedAudioFixture, BasicTestCase):
         sampler = ImbalancedDatasetSampler(dataset)
         sample = list(sampler)
         self.assertEqual(len(sample), 5)
+
+    def test_weighted_sampler_is_reused(self):
+        bdm = BaseDataModule(self.config.vocoder)
+        bdm.use_weighted_sampler = True
+        dataset = SpecDataset(
+            self.config.vocoder.training.filelist_loader(
+                self.config.vocoder.training.training_filelist
+            ),
+            self.config.vocoder,
+            use_segments=True,
+        )
+        sampler = bdm._get_sampler("train", dataset)
+        self.assertIsInstance(sampler, ImbalancedDatasetSampler)
+        self.assertIs(bdm._get_sampler("train", dataset), sampler)
+        self.assertIsNot(bdm._get_sampler("val", dataset), sampler)
+        bdm.use_weighted_sampler = False
+        self.assertIsNone(bdm._get_sampler("train", dataset))
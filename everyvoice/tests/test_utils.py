@@ -1,3 +1,7 @@
+import csv
+import io
+import json
+import os
 import re
 import tempfile
 from pathlib import Path
@@ -18,8 +22,14 @@ from everyvoice.config.validation_helpers import (
     path_is_a_directory,
     relative_to_absolute_path,
 )
-from everyvoice.tests.stubs import capture_logs, patch_logger, silence_c_stderr
-from everyvoice.utils import write_filelist
+from everyvoice.tests.stubs import (
+    capture_logs,
+    monkeypatch,
+    patch_logger,
+    silence_c_stderr,
+    temp_chdir,
+)
+from everyvoice.utils import load_config_from_json_or_yaml_path, write_filelist
 from everyvoice.utils.heavy import get_device_from_accelerator
 
 
@@ -53,6 +63,219 @@ class UtilsTest(TestCase):
             self.assertEqual(headers[3], "phones")
             self.assertEqual(headers[4], "extra")
 
+    def test_write_filelist_escaping(self):
+        """The fast filelist writer must escape fields exactly like csv.DictWriter"""
+        files = [
+            {"basename": "a|b", "characters": 'c\\d"e', "extra": 1.5},
+            {"basename": "f\ng", "characters": None},
+            {"basename": "h\ri", "characters": "j\r\nk"},
+        ]
+        with tempfile.TemporaryDirectory() as tempdir:
+            fast_path = Path(tempdir) / "fast.psv"
+            csv_path = Path(tempdir) / "csv.psv"
+            write_filelist(files, fast_path)
+            write_filelist(files, csv_path, use_csv_writer=True)
+            self.assertEqual(fast_path.read_bytes(), csv_path.read_bytes())
+            self.assertEqual(
+                everyvoice.utils.generic_dict_loader(fast_path)[0]["basename"], "a|b"
+            )
+
+    def test_fast_psv_load(self):
+        """fast_psv_load must parse filelists exactly like generic_dict_loader"""
+        data_dir = Path(__file__).parent / "data"
+        for filelist in ("metadata.psv", "metadata_slash_pipe.psv", "empty.psv"):
+            self.assertEqual(
+                everyvoice.utils.fast_psv_load(data_dir / filelist),
+                everyvoice.utils.generic_dict_loader(data_dir / filelist),
+            )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for contents in (
+                "basename|text|basename\na|hi|b\n",
+                "\ufeffbasename|text\na.wav|hi\n",
+            ):
+                path = Path(tmpdir) / "filelist.psv"
+                path.write_text(contents, encoding="utf8")
+                self.assertEqual(
+                    everyvoice.utils.fast_psv_load(path),
+                    everyvoice.utils.generic_dict_loader(path),
+                )
+
+    def test_pyarrow_backend(self):
+        """backend="pyarrow" must parse filelists exactly like the default backend"""
+        data_dir = Path(__file__).parent / "data"
+        for filelist, delimiter in (
+            ("metadata_slash_pipe.psv", "|"),
+            ("language-col.tsv", "\t"),
+            ("empty.psv", "|"),
+        ):
+            self.assertEqual(
+                everyvoice.utils.generic_dict_loader(
+                    data_dir / filelist, delimiter=delimiter, backend="pyarrow"
+                ),
+                everyvoice.utils.generic_dict_loader(
+                    data_dir / filelist, delimiter=delimiter
+                ),
+            )
+
+    def test_split_dict_rows(self):
+        """The str.split() fast path must give the same rows as csv.DictReader"""
+        contents = "basename|text\r\n\na.wav|x\\|y\nb|one|extra\nc\nd|multi\\\nline\n"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "filelist.psv"
+            path.write_text(contents, encoding="utf8", newline="")
+            with open(path, newline="", encoding="utf8") as f:
+                expected = list(
+                    csv.DictReader(
+                        f, delimiter="|", quoting=csv.QUOTE_NONE, escapechar="\\"
+                    )
+                )
+            expected[0]["basename"] = "a"
+            self.assertEqual(everyvoice.utils.generic_dict_loader(path), expected)
+
+    def test_read_festival_with_bom(self):
+        """A festival filelist starting with a UTF-8 BOM is still festival"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "filelist.festival"
+            path.write_text(
+                '\ufeff( LJ001 "hello there" )\n( LJ002 "bye" )\n', encoding="utf8"
+            )
+            expected = [
+                {"basename": "LJ001", "text": "hello there"},
+                {"basename": "LJ002", "text": "bye"},
+            ]
+            self.assertEqual(everyvoice.utils.read_festival(path), expected)
+            self.assertEqual(
+                everyvoice.utils.sniff_and_return_filelist_data(path), expected
+            )
+
+    def test_dedupe_filelist(self):
+        """dedupe=True drops repeated (basename, text) rows and keeps the first"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "dups.psv"
+            path.write_text(
+                "basename|text|speaker\na|hi|s1\nb|hi|s1\na|hi|s2\na|ho|s1\n",
+                encoding="utf8",
+            )
+            rows = everyvoice.utils.generic_dict_loader(path, dedupe=True)
+            self.assertEqual(
+                [(r["basename"], r["text"], r["speaker"]) for r in rows],
+                [("a", "hi", "s1"), ("b", "hi", "s1"), ("a", "ho", "s1")],
+            )
+            self.assertEqual(len(everyvoice.utils.generic_dict_loader(path)), 4)
+            # Without a text column, rows are not deduplicated by basename alone
+            path.write_text(
+                "basename|speaker|characters\na|s1|hi\na|s2|ho\n", encoding="utf8"
+            )
+            with self.assertRaises(KeyError):
+                everyvoice.utils.generic_dict_loader(path, dedupe=True)
+            rows = everyvoice.utils.generic_dict_loader(
+                path, dedupe=True, dedupe_key=("basename", "characters")
+            )
+            self.assertEqual(len(rows), 2)
+
+    def test_filelist_json_sidecar(self):
+        """EVERYVOICE_FILELIST_CACHE=1 writes and then uses a .cache.json sidecar"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "filelist.psv"
+            sidecar_path = Path(tmpdir) / "filelist.psv.cache.json"
+            path.write_text("basename|text\na.wav|hi\n", encoding="utf8")
+            expected = [{"basename": "a", "text": "hi"}]
+            with monkeypatch(os, "environ", {"EVERYVOICE_FILELIST_CACHE": "1"}):
+                loader = everyvoice.utils.generic_dict_loader
+                self.assertEqual(loader(path), expected)
+                self.assertTrue(sidecar_path.exists())
+                self.assertEqual(loader(path), expected)
+                # Different loader options don't reuse the sidecar
+                self.assertEqual(
+                    loader(path, delimiter=","), [{"basename|text": "a.wav|hi"}]
+                )
+                # Neither does a modified filelist
+                path.write_text("basename|text\nb|ho\n", encoding="utf8")
+                self.assertEqual(loader(path), [{"basename": "b", "text": "ho"}])
+
+    def test_update_config_from_cli_args(self):
+        """All CLI overrides are merged and applied with a single update_config()"""
+
+        class RecordingConfig:
+            def __init__(self):
+                self.updates = []
+
+            def update_config(self, new_config):
+                self.updates.append(new_config)
+                return self
+
+        config = RecordingConfig()
+        with capture_logs():
+            everyvoice.utils.update_config_from_cli_args(
+                ["a.b=1", "a.c=2", "d=3", "a.b=4"], config
+            )
+        self.assertEqual(config.updates, [{"a": {"b": "4", "c": "2"}, "d": "3"}])
+        with self.assertRaises(ValueError):
+            everyvoice.utils.update_config_from_cli_args(["a.b"], config)
+        with self.assertRaisesRegex(ValueError, "Invalid config string"):
+            everyvoice.utils.update_config_from_cli_args(["a.b=c=d"], config)
+        self.assertEqual(len(config.updates), 1)
+
+    def test_load_config_cache(self):
+        """Cached configs are returned as copies and refreshed when the file changes"""
+        with tempfile.TemporaryDirectory() as tempdir:
+            config_path = Path(tempdir) / "config.yaml"
+            config_path.write_text("a:\n  b: 1\n", encoding="utf8")
+            config = load_config_from_json_or_yaml_path(config_path)
+            self.assertEqual(config, {"a": {"b": 1}})
+            config["a"]["b"] = 2
+            self.assertEqual(
+                load_config_from_json_or_yaml_path(config_path), {"a": {"b": 1}}
+            )
+            config_path.write_text("a:\n  b: 12\n", encoding="utf8")
+            self.assertEqual(
+                load_config_from_json_or_yaml_path(config_path), {"a": {"b": 12}}
+            )
+            with self.assertRaises(ValueError):
+                load_config_from_json_or_yaml_path(Path(tempdir) / "missing.yaml")
+
+    def test_load_config_json_sidecar(self):
+        """EVERYVOICE_YAML_CACHE=1 writes and then uses a .cache.json sidecar"""
+        with tempfile.TemporaryDirectory() as tempdir:
+            config_path = Path(tempdir) / "config.yaml"
+            sidecar_path = Path(tempdir) / "config.yaml.cache.json"
+            config_path.write_text("a:\n  b: 1\n", encoding="utf8")
+            with monkeypatch(os, "environ", {"EVERYVOICE_YAML_CACHE": "1"}):
+                everyvoice.utils._CONFIG_CACHE.clear()
+                load_config_from_json_or_yaml_path(config_path)
+                self.assertTrue(sidecar_path.exists())
+                sidecar = json.loads(sidecar_path.read_text(encoding="utf8"))
+                sidecar["data"] = {"a": {"b": 3}}
+                sidecar_path.write_text(json.dumps(sidecar), encoding="utf8")
+                everyvoice.utils._CONFIG_CACHE.clear()
+                self.assertEqual(
+                    load_config_from_json_or_yaml_path(config_path), {"a": {"b": 3}}
+                )
+                # Restoring an older copy of the config, even of the same size,
+                # must not reuse the sidecar
+                mtime_ns = config_path.stat().st_mtime_ns
+                config_path.write_text("a:\n  b: 2\n", encoding="utf8")
+                os.utime(config_path, ns=(mtime_ns - 10**9, mtime_ns - 10**9))
+                everyvoice.utils._CONFIG_CACHE.clear()
+                self.assertEqual(
+                    load_config_from_json_or_yaml_path(config_path), {"a": {"b": 2}}
+                )
+            everyvoice.utils._CONFIG_CACHE.clear()
+            self.assertEqual(
+                load_config_from_json_or_yaml_path(config_path), {"a": {"b": 2}}
+            )
+
+    def test_tqdm_joblib_context_is_deprecated(self):
+        from joblib import Parallel, delayed
+        from tqdm import tqdm
+
+        progress = tqdm(total=3, file=io.StringIO())
+        with self.assertWarns(DeprecationWarning):
+            with everyvoice.utils.tqdm_joblib_context(progress):
+                results = Parallel(n_jobs=1)(delayed(abs)(i) for i in (-1, -2, -3))
+        self.assertEqual(results, [1, 2, 3])
+        self.assertEqual(progress.n, 3)
+
 
 class ContextableBaseModel(BaseModel):
     """
@@ -140,6 +363,16 @@ class PathIsADirectoryTest(TestCase):
         ):
             PathIsADirectory(path=path)
 
+    def test_deleted_directory(self):
+        """A directory deleted after it was validated is no longer accepted"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "test_deleted_directory"
+            path.mkdir()
+            PathIsADirectory(path=path)
+            path.rmdir()
+            with self.assertRaises(ValueError):
+                PathIsADirectory(path=path)
+
 
 class RelativePathToAbsolute(ContextableBaseModel):
     """Dummy Class for RelativePathToAbsoluteTest"""
@@ -256,6 +489,30 @@ class DirectoryPathMustExistTest(TestCase):
             self.assertTrue(path.exists())
             self.assertTrue(dir.path.exists())
 
+    def test_missing_directory_is_created_again(self):
+        """A directory deleted after it was validated is created again"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "test_missing_directory"
+            with capture_logs():
+                DirectoryPathMustExist(path=path)
+            path.rmdir()
+            with capture_logs():
+                DirectoryPathMustExist(path=path)
+            self.assertTrue(path.is_dir())
+
+    def test_relative_directory_after_chdir(self):
+        """The same relative path is created again in a new working directory"""
+        path = Path("test_relative_directory")
+        with tempfile.TemporaryDirectory() as tmpdir_a:
+            with tempfile.TemporaryDirectory() as tmpdir_b:
+                with temp_chdir(Path(tmpdir_a)), capture_logs():
+                    DirectoryPathMustExist(path=path)
+                with temp_chdir(Path(tmpdir_b)), capture_logs():
+                    DirectoryPathMustExist(path=path)
+                    PathIsADirectory(path=path)
+                self.assertTrue((Path(tmpdir_a) / path).is_dir())
+                self.assertTrue((Path(tmpdir_b) / path).is_dir())
+
 
 class GetDeviceFromAcceleratorTest(TestCase):
     def test_auto(self):
@@ -227,6 +227,14 @@ class WizardTest(TestCase):
         # got several steps.
         # self.monkey_run_tour() with a bunch of recursive answer would the thing to use here...
 
+    def test_next_step(self):
+        """Tour.next_step() must agree with Step.next(), also after the tree changes"""
+        tour = get_main_wizard_tour()
+        for _ in range(2):
+            for node in PreOrderIter(tour.root):
+                self.assertIs(tour.next_step(node), node.next())
+            tour.add_step(basic.NameStep(), tour.root.children[1])
+
     def test_visualize(self):
         tour = get_main_wizard_tour()
         with capture_stdout() as out:
@@ -1086,7 +1094,7 @@ class WizardTest(TestCase):
                 tmpdir / "out/project/config/everyvoice-text-to-spec.yaml",
                 encoding="utf8",
             ) as f:
-                text_to_spec_config = "\n".join(f)
+                text_to_spec_config = f.read()
             self.assertIn("multilingual: true", text_to_spec_config)
             self.assertIn("multispeaker: true", text_to_spec_config)
 
@@ -1096,8 +1104,7 @@ class WizardTest(TestCase):
             with open(tmpdir / "filelist.psv", "w", encoding="utf8") as f:
                 f.write("f1|foo bar|Joe\nf2|bar baz|Joe\nf3|baz foo|Joe\n")
             for basename in ("f1", "f2", "f3"):
-                with open(tmpdir / (basename + ".wav"), "wb"):
-                    pass
+                (tmpdir / (basename + ".wav")).touch()
             tour, _ = self.monkey_run_tour(
                 "Tour with datafile missing the header line",
                 [
@@ -1179,7 +1186,7 @@ class WizardTest(TestCase):
                 tmpdir / "out/project/config/everyvoice-text-to-spec.yaml",
                 encoding="utf8",
             ) as f:
-                text_to_spec_config = "\n".join(f)
+                text_to_spec_config = f.read()
             self.assertIn("multilingual: false", text_to_spec_config)
             self.assertIn("multispeaker: false", text_to_spec_config)
 
@@ -1189,8 +1196,7 @@ class WizardTest(TestCase):
             with open(tmpdir / "filelist.psv", "w", encoding="utf8") as f:
                 f.write("basename|text\nf1|foo bar\nf2|bar baz\nf3|baz foo\n")
             for basename in ("f1", "f2", "f3"):
-                with open(tmpdir / (basename + ".wav"), "wb"):
-                    pass
+                (tmpdir / (basename + ".wav")).touch()
             tour, _ = self.monkey_run_tour(
                 "Tour without enough columns to have speaker or language",
                 [
@@ -1273,7 +1279,7 @@ class WizardTest(TestCase):
             with open(
                 tmpdir / "out/project/dataset-filelist.psv", encoding="utf8"
             ) as f:
-                output_filelist = [line.rstrip() for line in f]
+                output_filelist = f.read().splitlines()
             expected_filelist = [
                 "basename|language|speaker|characters|phones",
                 "f1|und|speaker_0|foo bar|foo bar",
@@ -1304,6 +1310,14 @@ class WizardTest(TestCase):
             with capture_stdout(), self.assertRaises(SystemExit):
                 step.run()
 
+    def test_wavs_dir_rejected_path_is_rechecked(self):
+        step = dataset.WavsDirStep()
+        with capture_stdout(), tempfile.TemporaryDirectory() as tmpdirname:
+            self.assertFalse(step.validate(tmpdirname))
+            # The user fixes the directory and retries the same path
+            (Path(tmpdirname) / "sample.wav").touch()
+            self.assertTrue(step.validate(tmpdirname))
+
     def test_leading_white_space_in_outpath(self):
         """
         Make sure we strip leading spaces when the user accidentally adds a
@@ -1367,8 +1381,7 @@ class WizardTest(TestCase):
                     )
                 )
             for basename in ("f1", "f2", "f3"):
-                with open(tmpdir / (basename + ".wav"), "wb"):
-                    pass
+                (tmpdir / (basename + ".wav")).touch()
             tour, _ = self.monkey_run_tour(
                 "Tour with datafile in the festival format",
                 [
@@ -1445,7 +1458,7 @@ class WizardTest(TestCase):
             with open(
                 tmpdir / "out/project/dataset-filelist.psv", encoding="utf8"
             ) as f:
-                output_filelist = [line.rstrip() for line in f]
+                output_filelist = f.read().splitlines()
             expected_filelist = [
                 "basename|language|speaker|characters|phones",
                 "f1|und|default_speaker|foo bar|foo bar",
@@ -1484,8 +1497,7 @@ class WizardTest(TestCase):
                     )
                 )
             for basename in ("f1", "f2", "f3", "f4", "f5", "f6"):
-                with open(tmpdir / (basename + ".wav"), "wb"):
-                    pass
+                (tmpdir / (basename + ".wav")).touch()
             more_dataset_children_answers = [
                 RecursiveAnswers(
                     patch_questionary(tmpdir / "filelist2.txt")
@@ -1595,7 +1607,7 @@ class WizardTest(TestCase):
             with open(
                 tmpdir / "out/project/dataset0-filelist.psv", encoding="utf8"
             ) as f:
-                output_filelist = [line.rstrip() for line in f]
+                output_filelist = f.read().splitlines()
             expected_filelist1 = [
                 "basename|language|speaker|characters|phones",
                 "f1|eng|speaker_1|foo foo|fu fu",
@@ -1607,7 +1619,7 @@ class WizardTest(TestCase):
             with open(
                 tmpdir / "out/project/dataset1-filelist.psv", encoding="utf8"
             ) as f:
-                output_filelist = [line.rstrip() for line in f]
+                output_filelist = f.read().splitlines()
             expected_filelist2 = [
                 "basename|language|speaker|characters|phones",
                 "f4|und|default_speaker|foo bar|foo bar",
@@ -1620,7 +1632,7 @@ class WizardTest(TestCase):
                 tmpdir / "out/project/config/everyvoice-text-to-spec.yaml",
                 encoding="utf8",
             ) as f:
-                text_to_spec_config = "\n".join(f)
+                text_to_spec_config = f.read()
             self.assertIn("multilingual: true", text_to_spec_config)
             self.assertIn("multispeaker: true", text_to_spec_config)
 
@@ -1654,8 +1666,7 @@ class WizardTest(TestCase):
                     )
                 )
             for basename in ("f1", "f2", "f3", "f4", "f5", "f6"):
-                with open(tmpdir / (basename + ".wav"), "wb"):
-                    pass
+                (tmpdir / (basename + ".wav")).touch()
             more_dataset_children_answers = [
                 RecursiveAnswers(
                     patch_questionary(tmpdir / "filelist2.txt")
@@ -1770,7 +1781,7 @@ class WizardTest(TestCase):
             with open(
                 tmpdir / "out/project/dataset0-filelist.psv", encoding="utf8"
             ) as f:
-                output_filelist = [line.rstrip() for line in f]
+                output_filelist = f.read().splitlines()
             expected_filelist1 = [
                 "basename|language|speaker|characters|phones",
                 "f1|und|speaker_0|foo foo|foo foo",
@@ -1782,7 +1793,7 @@ class WizardTest(TestCase):
             with open(
                 tmpdir / "out/project/dataset1-filelist.psv", encoding="utf8"
             ) as f:
-                output_filelist = [line.rstrip() for line in f]
+                output_filelist = f.read().splitlines()
             expected_filelist2 = [
                 "basename|language|speaker|characters|phones",
                 "f4|und|speaker_0|foo bar|foo bar",
@@ -1795,7 +1806,7 @@ class WizardTest(TestCase):
                 tmpdir / "out/project/config/everyvoice-text-to-spec.yaml",
                 encoding="utf8",
             ) as f:
-                text_to_spec_config = "\n".join(f)
+                text_to_spec_config = f.read()
             self.assertIn("multilingual: false", text_to_spec_config)
             self.assertIn("multispeaker: false", text_to_spec_config)
 
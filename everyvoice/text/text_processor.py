@@ -62,6 +62,7 @@ class TextProcessor:
             for v in punctuation_type_values
         }
         self.punctuation_characters = list(self.punctuation_to_internal_id.keys())
+        self._punctuation_set = frozenset(self.punctuation_characters)
         assert set(self.punctuation_characters) == self.config.symbols.punctuation.all
 
         # Add the internal punctuation IDs to the symbols list
@@ -260,9 +261,8 @@ class TextProcessor:
             tokens, list
         ), f"The g2p engine for {lang_id} produced {type(tokens)} but must produce a list of tokenized phones."
         valid_tokens = []
-        punctuation_set = set(self.punctuation_characters)
         for token in tokens:
-            if token in self._symbol_to_id or token in punctuation_set:
+            if token in self._symbol_to_id or token in self._punctuation_set:
                 valid_tokens.append(token)
             else:
                 if find_missing:
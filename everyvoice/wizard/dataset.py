@@ -758,6 +758,21 @@ class TextProcessingStep(Step):
         from everyvoice.config.text_config import TextConfig
 
         self.saved_state = {}
+        # Apply the global default cleaners followed by any dataset-specified ones
+        # in a single pass over the data
+        cleaners = TextConfig().cleaners + [
+            self.process_lookup[process]["fn"] for process in self.response
+        ]
+        desc = ", ".join(
+            ["global default text normalization"]
+            + [self.process_lookup[process]["desc"] for process in self.response]
+        )
+
+        def clean(text):
+            for cleaner in cleaners:
+                text = cleaner(text)
+            return text
+
         # Get Text Index
         if self.state.get("filelist_data_list", None):
             self.saved_state["filelist_data_list"] = deepcopy(
@@ -766,56 +781,18 @@ class TextProcessingStep(Step):
             text_index = self.state["filelist_headers"].index(
                 self.state[StepNames.filelist_text_representation_step]
             )
-            # Process global cleaners
-            global_cleaners = TextConfig().cleaners
-            for cleaner in global_cleaners:
-                for i in tqdm(
-                    range(len(self.state["filelist_data_list"])),
-                    desc="Applying global default text normalization to data",
-                ):
-                    self.state["filelist_data_list"][i][text_index] = cleaner(
-                        self.state["filelist_data_list"][i][text_index]
-                    )
-            # Process any dataset-specified cleaners
-            for process in self.response:
-                process_fn = self.process_lookup[process]["fn"]
-                for i in tqdm(
-                    range(len(self.state["filelist_data_list"])),
-                    desc=f"Applying {self.process_lookup[process]['desc']} to data",
-                ):
-                    self.state["filelist_data_list"][i][text_index] = process_fn(
-                        self.state["filelist_data_list"][i][text_index]
-                    )
+            for row in tqdm(
+                self.state["filelist_data_list"], desc=f"Applying {desc} to data"
+            ):
+                row[text_index] = clean(row[text_index])
         else:
             self.saved_state["filelist_data"] = deepcopy(self.state["filelist_data"])
-            # Process global cleaners
-            global_cleaners = TextConfig().cleaners
-            for cleaner in global_cleaners:
-                for item in tqdm(
-                    self.state["filelist_data"],
-                    desc=f"Applying global default text normalization to '{self.state[StepNames.filelist_text_representation_step]}' data",
-                ):
-                    item[self.state[StepNames.filelist_text_representation_step]] = (
-                        cleaner(
-                            item[
-                                self.state[StepNames.filelist_text_representation_step]
-                            ]
-                        )
-                    )
-            # Process any dataset-specified cleaners
-            for process in self.response:
-                process_fn = self.process_lookup[process]["fn"]
-                for item in tqdm(
-                    self.state["filelist_data"],
-                    desc=f"Applying {self.process_lookup[process]['desc']} to '{self.state[StepNames.filelist_text_representation_step]}' data",
-                ):
-                    item[self.state[StepNames.filelist_text_representation_step]] = (
-                        process_fn(
-                            item[
-                                self.state[StepNames.filelist_text_representation_step]
-                            ]
-                        )
-                    )
+            text_key = self.state[StepNames.filelist_text_representation_step]
+            for item in tqdm(
+                self.state["filelist_data"],
+                desc=f"Applying {desc} to '{text_key}' data",
+            ):
+                item[text_key] = clean(item[text_key])
 
 
 class SoxEffectsStep(Step):
@@ -5,10 +5,9 @@ from typing import Optional, Sequence
 
 import questionary
 import yaml
-from anytree import PreOrderIter, RenderTree
+from anytree import PreOrderIter
 from packaging.version import Version
 from rich import print as rich_print
-from rich.panel import Panel
 
 from everyvoice._version import VERSION
 from everyvoice.wizard.prompts import (
@@ -193,6 +192,10 @@ class Tour:
         self.root.tour = self
         self.determine_state(self.root, self.state)
         self.add_steps(steps, self.root)
+        # Depth-first order of the steps, recomputed whenever the tree changes
+        self._step_order: list[Step] = []
+        self._step_positions: dict[int, int] = {}
+        self._step_order_version = -1
 
     def determine_state(self, step: Step, state: State):
         """Determines the state to use for the step based on the state subset"""
@@ -287,6 +290,7 @@ class Tour:
 
         Returns: the node to continue from after applying the saved history.
         """
+        from rich.panel import Panel
 
         try:
             with open(resume_from, "r", encoding="utf8") as f:
@@ -369,7 +373,7 @@ class Tour:
                 )
                 return node
 
-            node = node.next()
+            node = self.next_step(node)
             q_and_a = next(q_and_a_iter, None)
 
         if q_and_a is not None:
@@ -406,22 +410,42 @@ class Tour:
                 rich_print("\nKeyboard Interrupt")
                 node = self.keyboard_interrupt_action(node)
                 continue
-            node = node.next()
+            node = self.next_step(node)
+
+    def next_step(self, node: Step) -> Optional[Step]:
+        """Return the step after node in depth-first order, same as node.next(),
+        but looked up in a traversal order cached until the tree changes."""
+        if self._step_order_version != NodeMixinWithNavigation.tree_version:
+            self._step_order = list(PreOrderIter(self.root))
+            self._step_positions = {
+                id(step): i for i, step in enumerate(self._step_order)
+            }
+            self._step_order_version = NodeMixinWithNavigation.tree_version
+        position = self._step_positions.get(id(node))
+        if position is None:
+            # node is not part of this tour's tree (anymore)
+            return node.next()
+        if position + 1 < len(self._step_order):
+            return self._step_order[position + 1]
+        return None
 
     def visualize(self, highlight: Optional[Step] = None):
         """Display the tree structure of the tour on stdout"""
+        from anytree import RenderTree
+        from rich.panel import Panel
 
         def display(pre: str, name: str) -> str:
             return pre + name.replace(" Step", "").replace(
                 "Representation", "Rep."
             ).replace("Root", "Wizard Steps")
 
-        just_width = 4 + max(
-            len(display(pre, node.name)) for pre, _, node in RenderTree(self.root)
-        )
+        # Walk the tree only once, and render each line only once
+        entries = [
+            (display(pre, node.name), node) for pre, _, node in RenderTree(self.root)
+        ]
+        just_width = 4 + max(len(treestr) for treestr, _ in entries)
         text = ""
-        for pre, _, node in RenderTree(self.root):
-            treestr = display(pre, node.name)
+        for treestr, node in entries:
             if highlight is not None:
                 if node == highlight:
                     treestr = (
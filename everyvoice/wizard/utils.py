@@ -4,9 +4,7 @@ import os
 import re
 from collections import UserDict
 from enum import Enum
-from itertools import islice
 from pathlib import Path
-from typing import Iterable
 
 import yaml
 from anytree import NodeMixin, PreOrderIter
@@ -17,6 +15,7 @@ from everyvoice.config.type_definitions import (
     DatasetTextRepresentation,
     TargetTrainingTextRepresentationLevel,
 )
+from everyvoice.utils import open_filelist
 
 
 def rename_unknown_headers(headers):
@@ -119,10 +118,7 @@ def read_unknown_tabular_filelist(
     Returns:
         list[list[str]]: a list of rows containing a list of cell values
     """
-    f: Iterable[str]
-    with open(path, "r", newline="", encoding="utf8") as f:
-        if record_limit:
-            f = islice(f, record_limit)
+    with open_filelist(path, record_limit) as f:
         reader = csv.reader(
             f,
             delimiter=delimiter,
@@ -177,6 +173,16 @@ class NodeMixinWithNavigation(NodeMixin):
     """A NodeMixin subclass that allows for navigation between siblings
     as needed by the everyvoice wizard module."""
 
+    # Bumped whenever a node is attached to or detached from any tree, so that
+    # cached traversal orders can tell when they are stale.
+    tree_version = 0
+
+    def _post_attach(self, parent):
+        NodeMixinWithNavigation.tree_version += 1
+
+    def _post_detach(self, parent):
+        NodeMixinWithNavigation.tree_version += 1
+
     def next(self):
         """Return the next step in pre-order traversal"""
         if self.children: